@@ -7,6 +7,7 @@ from pyro.Enums.BuildEvent import BuildEvent
 from pyro.BuildFacade import BuildFacade
 from pyro.Comparators import startswith
 from pyro.PapyrusProject import PapyrusProject
+from pyro.PapyrusProjectError import PapyrusProjectError
 from pyro.PathHelper import PathHelper
 from pyro.PexReader import PexReader
 from pyro.ProjectOptions import ProjectOptions
@@ -56,7 +57,7 @@ class Application:
         return input_path
 
     def _validate_project(self, ppj: PapyrusProject) -> None:
-        if not ppj.options.game_path:
+        if not ppj.options.game_type:
             Application.log.error('Cannot determine game type from arguments or Papyrus Project')
             self._print_help_and_exit()
 
@@ -91,7 +92,11 @@ class Application:
             self._print_help_and_exit()
 
         options = ProjectOptions(self.args.__dict__)
-        ppj = PapyrusProject(options)
+        try:
+            ppj = PapyrusProject(options)
+        except PapyrusProjectError as e:
+            Application.log.error(e)
+            sys.exit(1)
 
         self._validate_project(ppj)
 
@@ -103,7 +108,12 @@ class Application:
         for _, path in ppj.psc_paths.items():
             Application.log.info(f'+ "{path}"')
 
-        build = BuildFacade(ppj)
+        # game path is not set until BuildFacade initializes
+        try:
+            build = BuildFacade(ppj)
+        except PapyrusProjectError as e:
+            Application.log.error(e)
+            sys.exit(1)
 
         # bsarch path is not set until BuildFacade initializes
         if ppj.options.package and not os.path.isfile(ppj.options.bsarch_path):
@@ -4,7 +4,6 @@ import os
 import re
 import sys
 import time
-from copy import deepcopy
 
 import psutil
 
@@ -19,8 +18,6 @@ from pyro.ProcessManager import ProcessManager
 from pyro.Enums.ProcessState import ProcessState
 from pyro.TimeElapsed import TimeElapsed
 
-from pyro.Comparators import endswith
-
 
 class BuildFacade:
     log: logging.Logger = logging.getLogger('pyro')
@@ -54,9 +51,10 @@ class BuildFacade:
         self.scripts_count = len(self.ppj.psc_paths)
 
         # WARN: if methods are renamed and their respective option names are not, this will break.
-        options: dict = deepcopy(self.ppj.options.__dict__)
+        # only the option names are needed, so copy the keys rather than deep copying every value
+        option_keys: list = list(self.ppj.options.__dict__)
 
-        for key in options:
+        for key in option_keys:
             if key in ('args', 'input_path', 'anonymize', 'package', 'zip', 'zip_compression'):
                 continue
             if key.startswith(('ignore_', 'no_', 'force_', 'resolve_')):
@@ -68,20 +66,20 @@ class BuildFacade:
     def _find_modified_scripts(self) -> list:
         pex_paths: list = []
 
+        pex_paths_by_name: dict = PathHelper.index_by_file_stem(self.ppj.pex_paths)
+
         for object_name, script_path in self.ppj.psc_paths.items():
             script_name, _ = os.path.splitext(os.path.basename(script_path))
 
             # if pex exists, compare time_t in pex header with psc's last modified timestamp
-            pex_match: list = [pex_path for pex_path in self.ppj.pex_paths if endswith(pex_path, f'{script_name}.pex', ignorecase=True)]
-            if not pex_match:
-                continue
-
-            pex_path: str = pex_match[0]
-            if not os.path.isfile(pex_path):
+            pex_path: str = pex_paths_by_name.get(script_name.casefold())
+            if not pex_path:
                 continue
 
             try:
                 header = PexReader.get_header(pex_path)
+            except OSError:
+                continue
             except ValueError:
                 BuildFacade.log.warning(f'Cannot determine compilation time due to unknown magic: "{pex_path}"')
                 continue
@@ -152,11 +150,10 @@ class BuildFacade:
         else:
             # these are absolute paths. there's no reason to manipulate them.
             for pex_path in self.ppj.pex_paths:
-                if not os.path.isfile(pex_path):
+                try:
+                    Anonymizer.anonymize_script(pex_path)
+                except FileNotFoundError:
                     BuildFacade.log.warning(f'Cannot locate file to anonymize: "{pex_path}"')
-                    continue
-
-                Anonymizer.anonymize_script(pex_path)
 
     def try_pack(self) -> None:
         """Generates BSA/BA2 packages for project"""
@@ -1,19 +1,16 @@
 import hashlib
-import io
+import itertools
 import os
+import stat
 import sys
 import typing
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
 
 from lxml import etree
 
 from pyro.CommandArguments import CommandArguments
-from pyro.Comparators import (is_folder_node,
-                              is_import_node,
-                              is_script_node,
-                              is_variable_node,
-                              startswith)
 from pyro.Enums.GameType import GameType
+from pyro.PapyrusProjectError import PapyrusProjectError
 from pyro.PathHelper import PathHelper
 from pyro.PexReader import PexReader
 from pyro.ProjectBase import ProjectBase
@@ -23,45 +20,78 @@ from pyro.Remotes import (GenericRemote,
 from pyro.XmlHelper import XmlHelper
 from pyro.XmlRoot import XmlRoot
 
+# compiled child selectors, equivalent to the is_*_node predicates in Comparators but evaluated by libxml2
+_FOLDER_NODES: etree.XPath = etree.XPath('*[local-name()="Folder"][text()]')
+_IMPORT_NODES: etree.XPath = etree.XPath('*[local-name()="Import"][text()]')
+_SCRIPT_NODES: etree.XPath = etree.XPath('*[local-name()="Script"][text()]')
+_VARIABLE_NODES: etree.XPath = etree.XPath('*[local-name()="Variable"]')
+
 
 class PapyrusProject(ProjectBase):
-    ppj_root: XmlRoot = None
-    folders_node: etree.ElementBase = None
-    imports_node: etree.ElementBase = None
-    packages_node: etree.ElementBase = None
-    scripts_node: etree.ElementBase = None
-    zip_files_node: etree.ElementBase = None
-    pre_build_node: etree.ElementBase = None
-    post_build_node: etree.ElementBase = None
-
-    has_folders_node: bool = False
-    has_imports_node: bool = False
-    has_packages_node: bool = False
-    has_scripts_node: bool = False
-    has_zip_files_node: bool = False
-    has_pre_build_node: bool = False
-    has_post_build_node: bool = False
-
-    remote: RemoteBase = None
+    __slots__ = ('ppj_root',
+                 'folders_node', 'imports_node', 'packages_node', 'scripts_node',
+                 'zip_files_node', 'pre_build_node', 'post_build_node',
+                 'has_folders_node', 'has_imports_node', 'has_packages_node', 'has_scripts_node',
+                 'has_zip_files_node', 'has_pre_build_node', 'has_post_build_node',
+                 'remote', 'remote_urls',
+                 'missing_scripts', 'pex_paths', 'psc_paths',
+                 '_stat_cache')
+
+    ppj_root: XmlRoot
+    folders_node: etree.ElementBase
+    imports_node: etree.ElementBase
+    packages_node: etree.ElementBase
+    scripts_node: etree.ElementBase
+    zip_files_node: etree.ElementBase
+    pre_build_node: etree.ElementBase
+    post_build_node: etree.ElementBase
+
+    has_folders_node: bool
+    has_imports_node: bool
+    has_packages_node: bool
+    has_scripts_node: bool
+    has_zip_files_node: bool
+    has_pre_build_node: bool
+    has_post_build_node: bool
+
+    ppj_bool_keys: tuple = ('Optimize', 'Release', 'Final', 'Anonymize', 'Package', 'Zip')
+    bool_keys: frozenset = frozenset(ppj_bool_keys + ('NoRecurse', 'UseInBuild'))
+    true_values: frozenset = frozenset(('true', '1'))
+
+    remote: RemoteBase
+    # lowercase, so _is_remote can test a lowered prefix against the tuple directly
     remote_schemas: tuple = ('https:', 'http:')
 
-    zip_file_name: str = ''
-    zip_root_path: str = ''
+    # not named *_paths because ProjectBase.__setattr__ would normalize the URLs as file paths
+    remote_urls: list
+
+    missing_scripts: dict
+    pex_paths: list
+    psc_paths: dict
 
-    missing_scripts: dict = {}
-    pex_paths: list = []
-    psc_paths: dict = {}
+    _stat_cache: dict
 
     def __init__(self, options: ProjectOptions) -> None:
         super(PapyrusProject, self).__init__(options)
 
+        self.remote = None
+        self.remote_urls = []
+
+        self.missing_scripts = {}
+        self.pex_paths = []
+        self.psc_paths = {}
+
+        # stat results keyed by normalized path, shared by all existence checks while loading
+        self._stat_cache = {}
+
         xml_parser: etree.XMLParser = etree.XMLParser(remove_blank_text=True, remove_comments=True)
 
         # strip comments from raw text because lxml.etree.XMLParser does not remove XML-unsupported comments
         # e.g., '<PapyrusProject <!-- xmlns="PapyrusProject.xsd" -->>'
-        xml_document: io.StringIO = XmlHelper.strip_xml_comments(self.options.input_path)
+        for xml_chunk in XmlHelper.strip_xml_comments(self.options.input_path):
+            xml_parser.feed(xml_chunk)
 
-        project_xml: etree.ElementTree = etree.parse(xml_document, xml_parser)
+        project_xml: etree.ElementTree = etree.ElementTree(xml_parser.close())
 
         self.ppj_root = XmlRoot(project_xml)
 
@@ -71,8 +101,7 @@ class PapyrusProject(ProjectBase):
             try:
                 schema.assertValid(project_xml)
             except etree.DocumentInvalid as e:
-                PapyrusProject.log.error(f'Failed to validate XML Schema.{os.linesep}\t{e}')
-                sys.exit(1)
+                raise PapyrusProjectError(f'Failed to validate XML Schema.{os.linesep}\t{e}') from e
             else:
                 PapyrusProject.log.info('Successfully validated XML Schema.')
 
@@ -90,16 +119,19 @@ class PapyrusProject(ProjectBase):
             PapyrusProject.log.debug(f'Resolved PPJ. Text output:{os.linesep * 2}{xml_output.decode()}')
             sys.exit(1)
 
-        self.options.flags_path = self.ppj_root.get('Flags')
-        self.options.output_path = self.ppj_root.get('Output')
+        # root attributes are final after _update_attributes, so read them from a plain dict snapshot
+        ppj_attributes: dict = dict(self.ppj_root.node.attrib)
 
-        self.optimize = self.ppj_root.get('Optimize') == 'True'
-        self.release = self.ppj_root.get('Release') == 'True'
-        self.final = self.ppj_root.get('Final') == 'True'
+        self.options.flags_path = ppj_attributes.get('Flags')
+        self.options.output_path = ppj_attributes.get('Output')
 
-        self.options.anonymize = self.ppj_root.get('Anonymize') == 'True'
-        self.options.package = self.ppj_root.get('Package') == 'True'
-        self.options.zip = self.ppj_root.get('Zip') == 'True'
+        self.optimize = ppj_attributes.get('Optimize') == 'True'
+        self.release = ppj_attributes.get('Release') == 'True'
+        self.final = ppj_attributes.get('Final') == 'True'
+
+        self.options.anonymize = ppj_attributes.get('Anonymize') == 'True'
+        self.options.package = ppj_attributes.get('Package') == 'True'
+        self.options.zip = ppj_attributes.get('Zip') == 'True'
 
         self.imports_node = self.ppj_root.find('Imports')
         self.has_imports_node = self.imports_node is not None
@@ -130,6 +162,9 @@ class PapyrusProject(ProjectBase):
             if not self.options.zip_output_path:
                 self.options.zip_output_path = self.zip_files_node.get('Output')
 
+        # collect remote paths once, they are needed again for validation below
+        self.remote_urls = self._get_remote_urls()
+
         # initialize remote if needed
         if self.remote_paths:
             if not self.options.remote_temp_path:
@@ -140,15 +175,13 @@ class PapyrusProject(ProjectBase):
             # validate remote paths
             for path in self.remote_paths:
                 if not self.remote.validate_url(path):
-                    PapyrusProject.log.error(f'Cannot proceed while node contains invalid URL: "{path}"')
-                    sys.exit(1)
+                    raise PapyrusProjectError(f'Cannot proceed while node contains invalid URL: "{path}"')
 
         # we need to populate the list of import paths before we try to determine the game type
         # because the game type can be determined from import paths
         self.import_paths = self._get_import_paths()
         if not self.import_paths:
-            PapyrusProject.log.error('Failed to build list of import paths')
-            sys.exit(1)
+            raise PapyrusProjectError('Failed to build list of import paths')
 
         # ensure that folder paths are implicitly imported
         implicit_folder_paths: list = self._get_implicit_folder_imports()
@@ -165,11 +198,10 @@ class PapyrusProject(ProjectBase):
         # not sure if this must run again after populating implicit import paths from psc paths
         self.psc_paths = self._get_psc_paths()
         if not self.psc_paths:
-            PapyrusProject.log.error('Failed to build list of script paths')
-            sys.exit(1)
+            raise PapyrusProjectError('Failed to build list of script paths')
 
-        # this adds implicit imports from script paths
-        implicit_script_paths: list = self._get_implicit_script_imports()
+        # walk script paths once for both implicit imports and expected pex paths
+        implicit_script_paths, pex_paths_by_object_name = self._get_script_tables()
 
         if len(implicit_script_paths) > 0:
             PapyrusProject.log.info('Implicitly imported script paths found:')
@@ -181,7 +213,7 @@ class PapyrusProject(ProjectBase):
         # we need to set the game type after imports are populated but before pex paths are populated
         # allow xml to set game type but defer to passed argument
         if not self.options.game_type:
-            game_type: str = self.ppj_root.get('Game', default='').upper()
+            game_type: str = ppj_attributes.get('Game', '').upper()
 
             if game_type and GameType.has_member(game_type):
                 valid_game_type: GameType = GameType[game_type]
@@ -192,52 +224,35 @@ class PapyrusProject(ProjectBase):
             self.options.game_type = self.get_game_type()
 
         if not self.options.game_type:
-            PapyrusProject.log.error('Cannot determine game type from arguments or Papyrus Project')
-            sys.exit(1)
+            raise PapyrusProjectError('Cannot determine game type from arguments or Papyrus Project')
 
         # get expected pex paths - these paths may not exist and that is okay!
-        self.pex_paths = self._get_pex_paths()
+        self.pex_paths = list(dict.fromkeys(pex_paths_by_object_name.values()))
 
         # these are relative paths to psc scripts whose pex counterparts are missing
-        self.missing_scripts: dict = self._find_missing_script_paths()
-
-        # game type must be set before we call this
-        if not self.options.game_path:
-            self.options.game_path = self.get_game_path(self.options.game_type)
+        self.missing_scripts = self._find_missing_script_paths(pex_paths_by_object_name)
 
     @property
     def remote_paths(self) -> list:
         """
-        Collects list of remote paths from Import and Folder nodes
+        Returns list of remote paths from Import and Folder nodes
         """
-        results: list = []
-
-        if self.has_imports_node:
-            results.extend([node.text for node in filter(is_import_node, self.imports_node)
-                            if startswith(node.text, self.remote_schemas, ignorecase=True)])
-
-        if self.has_folders_node:
-            results.extend([node.text for node in filter(is_folder_node, self.folders_node)
-                            if startswith(node.text, self.remote_schemas, ignorecase=True)])
-
-        return results
+        return self.remote_urls
 
     def _parse_variables(self, variables_node: etree.ElementBase) -> None:
         reserved_characters: tuple = ('!', '#', '^', '&', '*')
 
-        for node in filter(is_variable_node, variables_node):
+        for node in _VARIABLE_NODES(variables_node):
             key, value = node.get('Name', default=''), node.get('Value', default='')
 
             if any([not key, not value]):
                 continue
 
             if not key.isalnum():
-                PapyrusProject.log.error(f'The name of the variable "{key}" must be an alphanumeric string.')
-                sys.exit(1)
+                raise PapyrusProjectError(f'The name of the variable "{key}" must be an alphanumeric string.')
 
             if any(c in reserved_characters for c in value):
-                PapyrusProject.log.error(f'The value of the variable "{key}" contains a reserved character.')
-                sys.exit(1)
+                raise PapyrusProjectError(f'The value of the variable "{key}" contains a reserved character.')
 
             self.variables.update({key: value})
 
@@ -252,66 +267,46 @@ class PapyrusProject(ProjectBase):
 
     def _update_attributes(self, parent_node: etree.ElementBase) -> None:
         """Updates attributes of element tree with missing attributes and default values"""
-        ppj_bool_keys = ['Optimize', 'Release', 'Final', 'Anonymize', 'Package', 'Zip']
-        other_bool_keys = ['NoRecurse', 'UseInBuild']
-
-        for node in parent_node.getiterator():
+        # default attribute values by local tag name, looked up once per element
+        project_defaults: dict = {'Game': '', 'Flags': self.options.flags_path, 'Output': self.options.output_path}
+        project_defaults.update((key, 'False') for key in self.ppj_bool_keys)
+        build_event_defaults: dict = {'Description': '', 'UseInBuild': 'True'}
+        folder_defaults: dict = {'NoRecurse': 'False'}
+
+        defaults_by_tag: dict = {
+            'PapyrusProject': project_defaults,
+            'Packages': {'Output': self.options.package_path},
+            'Package': {'Name': self.project_name, 'RootDir': self.project_path},
+            'Folder': folder_defaults,
+            'Include': folder_defaults,
+            'ZipFiles': {'Output': self.options.zip_output_path},
+            'ZipFile': {'Name': self.project_name, 'RootDir': self.project_path, 'Compression': 'deflate'},
+            'PreBuildEvent': build_event_defaults,
+            'PostBuildEvent': build_event_defaults,
+        }
+
+        # elements only; comments and processing instructions have no attributes to fill
+        for node in parent_node.iter(tag=etree.Element):
             if node.text:
                 node.text = self.parse(node.text.strip())
 
             if not node.attrib:
                 continue
 
-            tag = node.tag.replace('{%s}' % self.ppj_root.ns, '')
+            tag = etree.QName(node).localname
 
-            if tag == 'PapyrusProject':
-                if 'Game' not in node.attrib:
-                    node.set('Game', '')
-                if 'Flags' not in node.attrib:
-                    node.set('Flags', self.options.flags_path)
-                if 'Output' not in node.attrib:
-                    node.set('Output', self.options.output_path)
-                for key in ppj_bool_keys:
+            defaults: dict = defaults_by_tag.get(tag)
+            if defaults:
+                for key, value in defaults.items():
                     if key not in node.attrib:
-                        node.set(key, 'False')
-
-            elif tag == 'Packages':
-                if 'Output' not in node.attrib:
-                    node.set('Output', self.options.package_path)
-
-            elif tag == 'Package':
-                if 'Name' not in node.attrib:
-                    node.set('Name', self.project_name)
-                if 'RootDir' not in node.attrib:
-                    node.set('RootDir', self.project_path)
-
-            elif tag in ('Folder', 'Include'):
-                if 'NoRecurse' not in node.attrib:
-                    node.set('NoRecurse', 'False')
-
-            elif tag == 'ZipFiles':
-                if 'Output' not in node.attrib:
-                    node.set('Output', self.options.zip_output_path)
-
-            elif tag == 'ZipFile':
-                if 'Name' not in node.attrib:
-                    node.set('Name', self.project_name)
-                if 'RootDir' not in node.attrib:
-                    node.set('RootDir', self.project_path)
-                if 'Compression' not in node.attrib:
-                    node.set('Compression', 'deflate')
-                else:
-                    node.set('Compression', node.get('Compression').casefold())
+                        node.set(key, value)
 
-            elif tag == 'PreBuildEvent' or tag == 'PostBuildEvent':
-                if 'Description' not in node.attrib:
-                    node.set('Description', '')
-                if 'UseInBuild' not in node.attrib:
-                    node.set('UseInBuild', 'True')
+            if tag == 'ZipFile':
+                node.set('Compression', node.get('Compression').casefold())
 
             # parse values
             for key, value in node.attrib.items():
-                value = value.casefold() in ('true', '1') if key in ppj_bool_keys + other_bool_keys else self.parse(value)
+                value = value.casefold() in self.true_values if key in self.bool_keys else self.parse(value)
                 node.set(key, str(value))
 
     def _calculate_object_name(self, psc_path: str) -> str:
@@ -319,19 +314,22 @@ class PapyrusProject(ProjectBase):
 
     @staticmethod
     def _can_remove_folder(import_path: str, object_name: str, script_path: str) -> bool:
-        import_path = import_path.casefold()
-        object_name = object_name.casefold()
-        script_path = script_path.casefold()
+        """Arguments must already be casefolded"""
         return script_path.startswith(import_path) and os.path.join(import_path, object_name) != script_path
 
-    def _find_missing_script_paths(self) -> dict:
-        """Returns list of script paths for compiled scripts that do not exist"""
+    def _find_missing_script_paths(self, pex_paths: dict) -> dict:
+        """
+        Returns list of script paths for compiled scripts that do not exist
+
+        :param pex_paths: Expected pex paths keyed by object name
+        """
         results: dict = {}
 
-        for object_name, script_path in self.psc_paths.items():
-            pex_path: str = os.path.join(self.options.output_path, object_name.replace('.psc', '.pex'))
+        # scan each output folder once instead of checking every pex path individually
+        existing_pex_paths: set = PathHelper.find_existing_files(pex_paths.values())
 
-            if not os.path.isfile(pex_path) and script_path not in results:
+        for object_name, script_path in self.psc_paths.items():
+            if pex_paths[object_name] not in existing_pex_paths and script_path not in results:
                 object_name = script_path if not os.path.isabs(script_path) else self._calculate_object_name(script_path)
                 results[object_name] = script_path
 
@@ -344,8 +342,8 @@ class PapyrusProject(ProjectBase):
         if not self.has_imports_node:
             return []
 
-        for import_node in filter(is_import_node, self.imports_node):
-            if startswith(import_node.text, self.remote_schemas, ignorecase=True):
+        for import_node in _IMPORT_NODES(self.imports_node):
+            if self._is_remote(import_node.text):
                 local_path = self._get_remote_path(import_node)
                 PapyrusProject.log.info(f'Adding import path from remote: "{local_path}"...')
                 results.append(local_path)
@@ -363,11 +361,10 @@ class PapyrusProject(ProjectBase):
                 # relative import paths should be relative to the project
                 import_path = os.path.normpath(os.path.join(self.project_path, import_path))
 
-            if os.path.isdir(import_path):
+            if self._isdir(import_path):
                 results.append(import_path)
             else:
-                self.log.error(f'Import path does not exist: "{import_path}"')
-                sys.exit(1)
+                raise PapyrusProjectError(f'Import path does not exist: "{import_path}"')
 
         return PathHelper.uniqify(results)
 
@@ -378,54 +375,59 @@ class PapyrusProject(ProjectBase):
         if not self.has_folders_node:
             return []
 
-        for folder_node in filter(is_folder_node, self.folders_node):
+        for folder_node in _FOLDER_NODES(self.folders_node):
             folder_path: str = os.path.normpath(folder_node.text)
 
             if os.path.isabs(folder_path):
-                if os.path.isdir(folder_path) and folder_path not in self.import_paths:
+                if self._isdir(folder_path) and folder_path not in self.import_paths:
                     implicit_paths.append(folder_path)
             else:
                 test_path = os.path.join(self.project_path, folder_path)
-                if os.path.isdir(test_path) and test_path not in self.import_paths:
+                if self._isdir(test_path) and test_path not in self.import_paths:
                     implicit_paths.append(test_path)
 
         return PathHelper.uniqify(implicit_paths)
 
-    def _get_implicit_script_imports(self) -> list:
-        """Returns absolute implicit import paths from Script node paths"""
-        implicit_paths: list = []
+    def _get_script_tables(self) -> tuple:
+        """
+        Returns absolute implicit import paths from Script node paths, and absolute paths to compiled
+        scripts that may not exist yet in output folder keyed by object name, in a single pass
+        """
+        # dict keys keep insertion order without the linear scans of list membership tests
+        implicit_paths: dict = {}
+        known_import_paths: set = set(self.import_paths)
 
-        for object_name, script_path in self.psc_paths.items():
-            script_folder_path = os.path.dirname(script_path)
+        # casefolded with a trailing separator, so prefix tests only match whole folder names
+        import_path_prefixes: list = [(import_path, os.path.join(import_path, '').casefold())
+                                      for import_path in self.import_paths]
 
-            for import_path in self.import_paths:
-                # TODO: figure out how to handle imports on different drives
-                try:
-                    relpath = os.path.relpath(script_folder_path, import_path)
-                except ValueError as e:
-                    PapyrusProject.log.warning(f'{e} (path: "{script_folder_path}", start: "{import_path}")')
-                    continue
-
-                test_path = os.path.normpath(os.path.join(import_path, relpath))
-                if os.path.isdir(test_path) and test_path not in self.import_paths:
-                    implicit_paths.append(test_path)
+        pex_paths: dict = {}
 
-        return PathHelper.uniqify(implicit_paths)
+        for object_name, script_path in self.psc_paths.items():
+            # do not check if file exists, we do that in _find_missing_script_paths for a different reason
+            pex_paths[object_name] = os.path.join(self.options.output_path, object_name.replace('.psc', '.pex'))
 
-    def _get_pex_paths(self) -> list:
-        """
-        Returns absolute paths to compiled scripts that may not exist yet in output folder
-        """
-        pex_paths: list = []
+            script_folder_path = os.path.dirname(script_path)
+            script_folder_prefix = os.path.join(script_folder_path, '').casefold()
 
-        for object_name, script_path in self.psc_paths.items():
-            pex_path = os.path.join(self.options.output_path, object_name.replace('.psc', '.pex'))
+            for import_path, import_path_prefix in import_path_prefixes:
+                if script_folder_prefix.startswith(import_path_prefix):
+                    # same result as relpath when the script folder is under the import path
+                    test_path = os.path.normpath(import_path + script_folder_path[len(import_path):])
+                else:
+                    # TODO: figure out how to handle imports on different drives
+                    try:
+                        relpath = os.path.relpath(script_folder_path, import_path)
+                    except ValueError as e:
+                        PapyrusProject.log.warning(f'{e} (path: "{script_folder_path}", start: "{import_path}")')
+                        continue
 
-            # do not check if file exists, we do that in _find_missing_script_paths for a different reason
-            if pex_path not in pex_paths:
-                pex_paths.append(pex_path)
+                    test_path = os.path.normpath(os.path.join(import_path, relpath))
 
-        return pex_paths
+                if test_path not in implicit_paths and test_path not in known_import_paths and self._isdir(test_path):
+                    implicit_paths[test_path] = None
+
+        return list(implicit_paths), pex_paths
 
     def _get_psc_paths(self) -> dict:
         """Returns script paths from Folders and Scripts nodes"""
@@ -442,25 +444,26 @@ class PapyrusProject(ProjectBase):
                 object_name = script_path if not os.path.isabs(script_path) else self._calculate_object_name(script_path)
                 object_names[object_name] = script_path
 
+        # absolutize import paths once rather than for every script
+        absolute_import_paths: list = [import_path if os.path.isabs(import_path) else os.path.join(self.project_path, import_path)
+                                       for import_path in self.import_paths]
+
         # convert user paths to absolute paths
         for object_name, script_path in object_names.items():
             # ignore existing absolute paths
-            if os.path.isabs(script_path) and os.path.isfile(script_path):
+            if os.path.isabs(script_path) and self._isfile(script_path):
                 continue
 
             # try to add existing project-relative paths
             test_path = os.path.join(self.project_path, script_path)
-            if os.path.isfile(test_path):
+            if self._isfile(test_path):
                 object_names[object_name] = test_path
                 continue
 
             # try to add existing import-relative paths
-            for import_path in self.import_paths:
-                if not os.path.isabs(import_path):
-                    import_path = os.path.join(self.project_path, import_path)
-
+            for import_path in absolute_import_paths:
                 test_path = os.path.join(import_path, script_path)
-                if os.path.isfile(test_path):
+                if self._isfile(test_path):
                     object_names[object_name] = test_path
                     break
 
@@ -478,11 +481,9 @@ class PapyrusProject(ProjectBase):
                     if not message.startswith('Failed to load'):
                         PapyrusProject.log.info(message)
                     else:
-                        PapyrusProject.log.error(message)
-                        sys.exit(1)
+                        raise PapyrusProjectError(message)
             except PermissionError as e:
-                PapyrusProject.log.error(e.strerror)
-                sys.exit(1)
+                raise PapyrusProjectError(e.strerror) from e
 
         url_path = self.remote.create_local_path(node.text)
 
@@ -490,9 +491,22 @@ class PapyrusProject(ProjectBase):
 
         return local_path
 
+    @staticmethod
+    def _is_remote(text: str) -> bool:
+        """Returns whether node text starts with a remote schema"""
+        return bool(text) and text[:6].lower().startswith(PapyrusProject.remote_schemas)
+
+    def _get_remote_urls(self) -> list:
+        """Collects list of remote paths from Import and Folder nodes in a single pass"""
+        import_nodes = _IMPORT_NODES(self.imports_node) if self.has_imports_node else ()
+        folder_nodes = _FOLDER_NODES(self.folders_node) if self.has_folders_node else ()
+
+        return [node.text for node in itertools.chain(import_nodes, folder_nodes)
+                if self._is_remote(node.text)]
+
     def _get_script_paths_from_folders_node(self) -> typing.Generator:
         """Returns script paths from the Folders element array"""
-        for folder_node in filter(is_folder_node, self.folders_node):
+        for folder_node in _FOLDER_NODES(self.folders_node):
             if folder_node.text == os.pardir:
                 self.log.warning(f'Folder paths cannot be equal to "{os.pardir}"')
                 continue
@@ -504,7 +518,7 @@ class PapyrusProject(ProjectBase):
                 yield from PathHelper.find_script_paths_from_folder(self.project_path, no_recurse)
                 continue
 
-            if startswith(folder_node.text, self.remote_schemas, ignorecase=True):
+            if self._is_remote(folder_node.text):
                 local_path = self._get_remote_path(folder_node)
                 PapyrusProject.log.info(f'Adding import path from remote: "{local_path}"...')
                 self.import_paths.insert(0, local_path)
@@ -515,58 +529,84 @@ class PapyrusProject(ProjectBase):
             folder_path: str = os.path.normpath(folder_node.text)
 
             # try to add absolute path
-            if os.path.isabs(folder_path) and os.path.isdir(folder_path):
+            if os.path.isabs(folder_path) and self._isdir(folder_path):
                 yield from PathHelper.find_script_paths_from_folder(folder_path, no_recurse)
                 continue
 
             # try to add project-relative folder path
             test_path = os.path.join(self.project_path, folder_path)
-            if os.path.isdir(test_path):
+            if self._isdir(test_path):
                 yield from PathHelper.find_script_paths_from_folder(test_path, no_recurse)
                 continue
 
             # try to add import-relative folder path
             for import_path in self.import_paths:
                 test_path = os.path.join(import_path, folder_path)
-                if os.path.isdir(test_path):
+                if self._isdir(test_path):
                     yield from PathHelper.find_script_paths_from_folder(test_path, no_recurse)
 
     def _get_script_paths_from_scripts_node(self) -> typing.Generator:
         """Returns script paths from the Scripts node"""
-        for script_node in filter(is_script_node, self.scripts_node):
+        for script_node in _SCRIPT_NODES(self.scripts_node):
             if ':' in script_node.text:
                 script_node.text = script_node.text.replace(':', os.sep)
 
             yield os.path.normpath(script_node.text)
 
-    def _try_exclude_unmodified_scripts(self) -> dict:
-        psc_paths: dict = {}
+    def _isdir(self, path: str) -> bool:
+        stat_result = self._stat(path)
+        return stat_result is not None and stat.S_ISDIR(stat_result.st_mode)
 
-        for object_name, script_path in self.psc_paths.items():
-            script_name, _ = os.path.splitext(os.path.basename(script_path))
+    def _isfile(self, path: str) -> bool:
+        stat_result = self._stat(path)
+        return stat_result is not None and stat.S_ISREG(stat_result.st_mode)
 
-            # if pex exists, compare time_t in pex header with psc's last modified timestamp
-            matching_path: str = ''
-            for pex_path in self.pex_paths:
-                if pex_path.endswith(f'{script_name}.pex'):
-                    matching_path = pex_path
-                    break
-
-            if not os.path.isfile(matching_path):
-                continue
+    def _stat(self, path: str) -> typing.Optional[os.stat_result]:
+        """Returns cached stat result for path, or None if path does not exist"""
+        key = os.path.normcase(path)
 
+        if key not in self._stat_cache:
             try:
-                header = PexReader.get_header(matching_path)
-            except ValueError:
-                PapyrusProject.log.warning(f'Cannot determine compilation time due to unknown magic: "{matching_path}"')
-                continue
+                self._stat_cache[key] = os.stat(path)
+            except (OSError, ValueError):
+                self._stat_cache[key] = None
 
-            compiled_time: int = header.compilation_time.value
-            if os.path.getmtime(script_path) < compiled_time:
-                continue
+        return self._stat_cache[key]
 
-            if script_path not in psc_paths:
-                psc_paths[object_name] = script_path
+    def _is_script_modified(self, script_path: str, pex_paths_by_name: dict) -> bool:
+        """Returns whether script was modified after its existing pex counterpart was compiled"""
+        script_name, _ = os.path.splitext(os.path.basename(script_path))
+
+        # if pex exists, compare time_t in pex header with psc's last modified timestamp
+        matching_path: str = pex_paths_by_name.get(script_name.casefold())
+        if not matching_path:
+            return False
+
+        try:
+            header = PexReader.get_header(matching_path)
+        except OSError:
+            return False
+        except ValueError:
+            PapyrusProject.log.warning(f'Cannot determine compilation time due to unknown magic: "{matching_path}"')
+            return False
+
+        compiled_time: int = header.compilation_time.value
+        # stat the script again, because pre-build events can change scripts after the project is loaded
+        return os.path.getmtime(script_path) >= compiled_time
+
+    def _try_exclude_unmodified_scripts(self) -> dict:
+        psc_paths: dict = {}
+
+        pex_paths_by_name: dict = PathHelper.index_by_file_stem(self.pex_paths)
+
+        # header reads and stats are i/o-bound, so overlap them across scripts
+        with ThreadPoolExecutor(max_workers=self.get_worker_limit()) as executor:
+            modified_states = executor.map(lambda script_path: self._is_script_modified(script_path, pex_paths_by_name),
+                                           self.psc_paths.values())
+
+            for (object_name, script_path), is_modified in zip(self.psc_paths.items(), modified_states):
+                if is_modified and script_path not in psc_paths:
+                    psc_paths[object_name] = script_path
 
         return psc_paths
 
@@ -582,6 +622,18 @@ class PapyrusProject(ProjectBase):
         flags_path: str = self.options.flags_path
         output_path: str = self.options.output_path
 
+        # game type and compiler flags do not vary per script, so resolve them once
+        is_fallout4: bool = self.options.game_type == GameType.FO4
+
+        compiler_flags: list = []
+        if is_fallout4:
+            if self.release:
+                compiler_flags.append('-release')
+            if self.final:
+                compiler_flags.append('-final')
+        if self.optimize:
+            compiler_flags.append('-op')
+
         if self.options.no_incremental_build:
             psc_paths: dict = self.psc_paths
         else:
@@ -592,20 +644,19 @@ class PapyrusProject(ProjectBase):
             if object_name not in psc_paths.keys():
                 psc_paths[object_name] = script_path
 
-        source_import_paths = deepcopy(self.import_paths)
+        # casefold import paths once rather than once per script
+        casefolded_import_paths: list = [(import_path, import_path.casefold()) for import_path in self.import_paths]
 
         # TODO: depth sorting solution is not foolproof! parse psc files for imports to determine command order
         for object_name, script_path in psc_paths.items():
-            import_paths: list = self.import_paths
-
-            if self.options.game_type != GameType.FO4:
+            if is_fallout4:
+                # remove unnecessary import paths for script
+                object_name_cf, script_path_cf = object_name.casefold(), script_path.casefold()
+                import_paths: list = [import_path for import_path, import_path_cf in casefolded_import_paths
+                                      if not self._can_remove_folder(import_path_cf, object_name_cf, script_path_cf)]
+            else:
                 object_name = script_path
-
-            # remove unnecessary import paths for script
-            if self.options.game_type == GameType.FO4:
-                for import_path in reversed(self.import_paths):
-                    if self._can_remove_folder(import_path, object_name, script_path):
-                        import_paths.remove(import_path)
+                import_paths = self.import_paths
 
             arguments.clear()
             arguments.append(compiler_path, enquote_value=True)
@@ -614,21 +665,10 @@ class PapyrusProject(ProjectBase):
             arguments.append(';'.join(import_paths), key='i', enquote_value=True)
             arguments.append(output_path, key='o', enquote_value=True)
 
-            if self.options.game_type == GameType.FO4:
-                # noinspection PyUnboundLocalVariable
-                if self.release:
-                    arguments.append('-release')
-
-                # noinspection PyUnboundLocalVariable
-                if self.final:
-                    arguments.append('-final')
-
-            if self.optimize:
-                arguments.append('-op')
+            for compiler_flag in compiler_flags:
+                arguments.append(compiler_flag)
 
             arg_s = arguments.join()
             commands.append(arg_s)
 
-        self.import_paths = source_import_paths
-
         return commands
@@ -0,0 +1,5 @@
+class PapyrusProjectError(RuntimeError):
+    """
+    Raised when a Papyrus Project cannot be loaded
+    """
+    pass
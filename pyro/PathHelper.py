@@ -36,6 +36,28 @@ class PathHelper:
             if os.path.isfile(include_path):
                 yield include_path
 
+    @staticmethod
+    def find_existing_files(file_paths: Iterable) -> set:
+        """Returns set of file paths that exist, scanning each parent folder only once"""
+        file_names_by_folder: dict = {}
+        for file_path in file_paths:
+            folder_path, file_name = os.path.split(file_path)
+            file_names_by_folder.setdefault(folder_path, []).append(file_name)
+
+        results: set = set()
+
+        for folder_path, file_names in file_names_by_folder.items():
+            try:
+                with os.scandir(folder_path or os.curdir) as entries:
+                    existing_names: set = {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+            except OSError:
+                continue
+
+            results.update(os.path.join(folder_path, file_name) for file_name in file_names
+                           if os.path.normcase(file_name) in existing_names)
+
+        return results
+
     @staticmethod
     def find_script_paths_from_folder(folder_path: str, no_recurse: bool) -> Generator:
         """Yields existing script paths starting from absolute folder path"""
@@ -44,6 +66,15 @@ class PathHelper:
             if os.path.isfile(script_path) and endswith(script_path, '.psc', ignorecase=True):
                 yield script_path
 
+    @staticmethod
+    def index_by_file_stem(paths: Iterable) -> dict:
+        """Returns paths keyed by casefolded file name without extension, keeping the first path for each name"""
+        results: dict = {}
+        for path in paths:
+            file_stem, _ = os.path.splitext(os.path.basename(path))
+            results.setdefault(file_stem.casefold(), path)
+        return results
+
     @staticmethod
     def uniqify(items: Iterable) -> list:
         """Returns ordered list without duplicates"""
@@ -1,44 +1,207 @@
+import functools
+import locale
 import logging
 import os
+import queue
 import re
 import subprocess
-from decimal import Decimal
+import threading
+import typing
 
 from pyro.Enums.ProcessState import ProcessState
 
+# process output is filtered as bytes and decoded only when logged, with the encoding text mode pipes would use
+_OUTPUT_ENCODING: str = locale.getpreferredencoding(False)
+
+# bsarch banner and summary lines that are not logged
+_BSARCH_EXCLUSIONS: tuple = (
+    b'*',
+    b'[',
+    b'Archive Flags',
+    b'Bit',
+    b'BSArch',
+    b'Compressed',
+    b'Embed',
+    b'Files',
+    b'Format',
+    b'Packer',
+    b'Retain',
+    b'Startup',
+    b'Version',
+    b'XBox',
+    b'XMem'
+)
+
+# exclusions grouped by first byte, so each line is tested only against the few prefixes it could match
+_BSARCH_EXCLUSIONS_BY_FIRST_BYTE: dict = {
+    prefix[:1]: tuple(exclusion for exclusion in _BSARCH_EXCLUSIONS if exclusion[:1] == prefix[:1])
+    for prefix in _BSARCH_EXCLUSIONS
+}
+
+# bsarch status lines whose payloads are logged, e.g. "Packing: path", "Archive Name: path", "Done in 0:00:01.23."
+_BSARCH_PACKING_RE: re.Pattern = re.compile(rb'Packing[^:]*:\s*(.*)')
+_BSARCH_ARCHIVE_NAME_RE: re.Pattern = re.compile(rb'Archive Name[^:]*:\s*(.*)')
+_BSARCH_DONE_RE: re.Pattern = re.compile(rb'Done.*?in\s+(\d+):(\d+):(\d+(?:\.\d+)?)')
+
+
+def _format_bsarch_path(match: re.Match) -> str:
+    return ProcessManager._decode(match.group(1))
+
+
+def _format_bsarch_time(match: re.Match) -> str:
+    hours, minutes, seconds = match.groups()
+    return ProcessManager._format_time(int(hours), int(minutes), round(float(seconds), 3))
+
+
+# status patterns, log messages and payload formatters keyed by first byte,
+# so each line is tried against at most one pattern
+_BSARCH_STATUS_PATTERNS: dict = {
+    b'P': (_BSARCH_PACKING_RE, 'Packaging folder "%s"...', _format_bsarch_path),
+    b'A': (_BSARCH_ARCHIVE_NAME_RE, 'Building "%s"...', _format_bsarch_path),
+    b'D': (_BSARCH_DONE_RE, 'Packaging time: %s', _format_bsarch_time),
+}
+
+# compiler error lines, e.g. "C:\path\Script.psc(12,4): message"
+# the path is scanned lazily up to the first location, rather than consuming the whole line and backtracking;
+# it cannot be [^(]* because script paths can contain parentheses, e.g. "Program Files (x86)"
+_LINE_ERROR_RE: re.Pattern = re.compile(rb'(.*?)(\(\d+,\d+\)):\s+(.*)')
+
+# compiler banner and summary lines that are not logged
+_COMPILER_EXCLUSIONS: tuple = (
+    b'Assembly',
+    b'Batch',
+    b'Compilation',
+    b'Copyright',
+    b'Failed',
+    b'No output',
+    b'Papyrus',
+    b'Starting'
+)
+
 
 class ProcessManager:
     log: logging.Logger = logging.getLogger('pyro')
 
     @staticmethod
-    def _format_time(hours: Decimal, minutes: Decimal, seconds: Decimal) -> str:
-        if hours.compare(0) == 1 and minutes.compare(0) == 1 and seconds.compare(0) == 1:
-            return f'{hours}h {minutes}m {seconds}s'
-        if hours.compare(0) == 0 and minutes.compare(0) == 1 and seconds.compare(0) == 1:
-            return f'{minutes}m {seconds}s'
-        if hours.compare(0) == 0 and minutes.compare(0) == 0 and seconds.compare(0) == 1:
-            return f'{seconds}s'
-        return f'{hours}h {minutes}m {seconds}s'
+    def _format_time(hours: int, minutes: int, seconds: float) -> str:
+        """Returns time as "1h 2m 3.000s", omitting zero fields"""
+        parts: list = []
+        if hours:
+            parts.append(f'{hours}h')
+        if minutes:
+            parts.append(f'{minutes}m')
+        if seconds or not parts:
+            parts.append(f'{seconds:.3f}s')
+        return ' '.join(parts)
+
+    @staticmethod
+    def _decode(line: bytes) -> str:
+        return line.decode(_OUTPUT_ENCODING, 'replace')
+
+    @staticmethod
+    def _get_line_loggers() -> tuple:
+        """Returns whether INFO is enabled, and the logging and decoding callables for per-line use"""
+        # output is only decoded and formatted when it will be logged, and the callables are bound
+        # once rather than resolving attributes for every line of output
+        return ProcessManager.log.isEnabledFor(logging.INFO), ProcessManager.log.info, ProcessManager._decode
 
     @staticmethod
-    def run_command(command: str, cwd: str, env: dict) -> ProcessState:
+    def _spawn(command: typing.Union[str, list], *, shell: bool = False,
+               cwd: str = None, env: dict = None) -> typing.Optional[subprocess.Popen]:
+        """Creates process with stderr merged into a stdout pipe, or logs why the process cannot be created"""
         try:
-            process = subprocess.Popen(command,
-                                       stdout=subprocess.PIPE,
-                                       stderr=subprocess.STDOUT,
-                                       universal_newlines=True,
-                                       shell=True,
-                                       cwd=cwd,
-                                       env=env)
-        except WindowsError as e:
-            ProcessManager.log.error(f'Cannot create process because: {e.strerror}')
+            return subprocess.Popen(command,
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT,
+                                    shell=shell,
+                                    cwd=cwd,
+                                    env=env)
+        except OSError as e:
+            ProcessManager.log.error(f'Cannot create process because: {e.strerror or e}')
+            return None
+
+    @staticmethod
+    def _read_lines(fd: int, chunk_size: int = 65536) -> typing.Generator:
+        """Yields raw lines of process output as bytes, reading the pipe in large chunks rather than line by line"""
+        # os.read returns an empty bytes object only at end of output. the read is bound once, so
+        # each chunk does not resolve os.read and rebuild its arguments
+        yield from ProcessManager._split_lines(iter(functools.partial(os.read, fd, chunk_size), b''))
+
+    @staticmethod
+    def _read_lines_in_background(process: subprocess.Popen, chunk_size: int = 65536) -> typing.Generator:
+        """Yields raw lines of process output as bytes, while a reader thread keeps the pipe drained, until the process exits"""
+        fd: int = process.stdout.fileno()
+        chunks: queue.SimpleQueue = queue.SimpleQueue()
+
+        def drain() -> None:
+            put = chunks.put
+            try:
+                for chunk in iter(functools.partial(os.read, fd, chunk_size), b''):
+                    put(chunk)
+            finally:
+                # a failed read must still end the output, or the consumer would block forever
+                put(None)
+
+        def wait() -> None:
+            process.wait()
+            # detached descendants can hold the pipe open after the process exits, so end the output
+            # if the reader does not reach the end of it shortly after
+            reader.join(timeout=1)
+            chunks.put(None)
+
+        reader = threading.Thread(target=drain, daemon=True)
+        reader.start()
+        threading.Thread(target=wait, daemon=True).start()
+
+        # whichever thread finishes first ends the output
+        yield from ProcessManager._split_lines(iter(chunks.get, None))
+
+    @staticmethod
+    def _split_lines(chunks: typing.Iterable) -> typing.Generator:
+        """
+        Yields unstripped lines from chunks of bytes, carrying partial lines over to the next chunk
+
+        Output rarely has leading whitespace, so callers test exclusions before allocating a stripped copy.
+        """
+        pending: bytes = b''
+
+        for chunk in chunks:
+            text, newline, pending = (pending + chunk).rpartition(b'\n')
+            if newline:
+                for line in text.split(b'\n'):
+                    yield line
+
+        if pending:
+            yield pending
+
+    @staticmethod
+    def run_command(command: typing.Union[str, list], cwd: str, env: dict) -> ProcessState:
+        """
+        Creates process and logs output to console
+
+        :param command: Command line to run through the shell, or list of program and arguments to run directly
+        :param cwd: Working directory for process
+        :param env: Environment variables for process
+        :return: ProcessState (SUCCESS, FAILURE, INTERRUPTED)
+        """
+        # build event commands are chained with && and may use shell built-ins, so only argument lists skip the shell
+        process = ProcessManager._spawn(command, shell=isinstance(command, str), cwd=cwd, env=env)
+        if process is None:
             return ProcessState.FAILURE
 
+        is_info_enabled, log_info, decode = ProcessManager._get_line_loggers()
+
         try:
-            while process.poll() is None:
-                line: str = process.stdout.readline().strip()
+            # build events can emit output in bursts, so drain the pipe on a separate thread while logging
+            for line in ProcessManager._read_lines_in_background(process):
+                if not is_info_enabled:
+                    continue
+
+                line = line.strip()
                 if line:
-                    ProcessManager.log.info(line)
+                    log_info('%s', decode(line))
+
+            process.wait()
 
         except KeyboardInterrupt:
             try:
@@ -57,61 +220,33 @@ class ProcessManager:
         :param command: Command to execute, including absolute path to executable and its arguments
         :return: ProcessState (SUCCESS, FAILURE, INTERRUPTED, ERRORS)
         """
-        try:
-            process = subprocess.Popen(command,
-                                       stdout=subprocess.PIPE,
-                                       stderr=subprocess.STDOUT,
-                                       universal_newlines=True)
-        except WindowsError as e:
-            ProcessManager.log.error(f'Cannot create process because: {e.strerror}')
+        process = ProcessManager._spawn(command)
+        if process is None:
             return ProcessState.FAILURE
 
-        exclusions = (
-            '*',
-            '[',
-            'Archive Flags',
-            'Bit',
-            'BSArch',
-            'Compressed',
-            'Embed',
-            'Files',
-            'Format',
-            'Packer',
-            'Retain',
-            'Startup',
-            'Version',
-            'XBox',
-            'XMem'
-        )
+        is_info_enabled, log_info, decode = ProcessManager._get_line_loggers()
 
         try:
-            while process.poll() is None:
-                line = process.stdout.readline().strip()
-
-                if line.startswith(exclusions):
+            for line in ProcessManager._read_lines(process.stdout.fileno()):
+                if not is_info_enabled or line.startswith(_BSARCH_EXCLUSIONS_BY_FIRST_BYTE.get(line[:1], ())):
                     continue
 
-                if line.startswith('Packing'):
-                    package_path = line.split(':', 1)[1].strip()
-                    ProcessManager.log.info(f'Packaging folder "{package_path}"...')
+                line = line.strip()
+                if line.startswith(_BSARCH_EXCLUSIONS_BY_FIRST_BYTE.get(line[:1], ())):
                     continue
 
-                if line.startswith('Archive Name'):
-                    archive_path = line.split(':', 1)[1].strip()
-                    ProcessManager.log.info(f'Building "{archive_path}"...')
-                    continue
+                status = _BSARCH_STATUS_PATTERNS.get(line[:1])
+                match = status[0].match(line) if status is not None else None
 
-                if line.startswith('Done'):
-                    archive_time = line.split('in')[1].strip()[:-1]
-                    hours, minutes, seconds = [round(Decimal(n), 3) for n in archive_time.split(':')]
-
-                    timecode = ProcessManager._format_time(hours, minutes, seconds)
-
-                    ProcessManager.log.info(f'Packaging time: {timecode}')
+                if match is not None:
+                    _, message, format_payload = status
+                    log_info(message, format_payload(match))
                     continue
 
                 if line:
-                    ProcessManager.log.info(line)
+                    log_info('%s', decode(line))
+
+            process.wait()
 
         except KeyboardInterrupt:
             try:
@@ -136,47 +271,44 @@ class ProcessManager:
             ProcessManager.log.error(f'Cannot create process because command exceeds max length: {command_size}')
             return ProcessState.FAILURE
 
-        try:
-            process = subprocess.Popen(command,
-                                       stdout=subprocess.PIPE,
-                                       stderr=subprocess.STDOUT,
-                                       universal_newlines=True)
-        except WindowsError as e:
-            ProcessManager.log.error(f'Cannot create process because: {e.strerror}')
+        process = ProcessManager._spawn(command)
+        if process is None:
             return ProcessState.FAILURE
 
-        exclusions = (
-            'Assembly',
-            'Batch',
-            'Compilation',
-            'Copyright',
-            'Failed',
-            'No output',
-            'Papyrus',
-            'Starting'
-        )
-
-        line_error = re.compile(r'(.*)(\(\d+,\d+\)):\s+(.*)')
+        is_info_enabled, log_info, decode = ProcessManager._get_line_loggers()
 
         try:
-            while process.poll() is None:
-                line = process.stdout.readline().strip()
+            for line in ProcessManager._read_lines(process.stdout.fileno()):
+                if line.startswith(_COMPILER_EXCLUSIONS):
+                    continue
 
-                if not line or line.startswith(exclusions):
+                line = line.strip()
+                if not line or line.startswith(_COMPILER_EXCLUSIONS):
                     continue
 
-                match = line_error.search(line)
+                # only lines with a location can be errors, so skip the regex for everything else
+                match = _LINE_ERROR_RE.match(line) if b'):' in line else None
 
                 if match is not None:
-                    path, location, message = match.groups()
-                    head, tail = os.path.split(path)
-                    ProcessManager.log.error(f'COMPILATION FAILED: '
-                                             f'{os.path.basename(head)}\\{tail}{location}: {message}')
+                    path, location, message = (decode(group) for group in match.groups())
+                    # only the script file and its parent folder are shown
+                    head, _, tail = path.rpartition(os.sep)
+                    _, _, parent = head.rpartition(os.sep)
+                    ProcessManager.log.error('COMPILATION FAILED: %s\\%s%s: %s', parent, tail, location, message)
+
+                    # reap the terminated compiler, so failed builds do not leave processes behind
                     process.terminate()
+                    try:
+                        process.wait(timeout=1)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                        process.wait()
                     return ProcessState.ERRORS
 
-                if 'error(s)' not in line:
-                    ProcessManager.log.info(line)
+                if is_info_enabled and b'error(s)' not in line:
+                    log_info('%s', decode(line))
+
+            process.wait()
 
         except KeyboardInterrupt:
             try:
@@ -6,14 +6,27 @@ from typing import List, Union
 from pyro.Comparators import (endswith,
                               startswith)
 from pyro.Enums.GameType import GameType
+from pyro.PapyrusProjectError import PapyrusProjectError
 from pyro.ProjectOptions import ProjectOptions
 from pyro.StringTemplate import StringTemplate
 
+if sys.platform == 'win32':
+    import winreg
+
+_PROGRAM_PATH: str = os.path.dirname(__file__)
+if endswith(sys.argv[0], ('pyro', '.exe')):
+    _PROGRAM_PATH = os.path.abspath(os.path.join(_PROGRAM_PATH, os.pardir))
+
 
 class ProjectBase:
+    __slots__ = ('options', 'variables',
+                 'program_path', 'project_name', 'project_path',
+                 'import_paths',
+                 'final', 'optimize', 'release')
+
     log: logging.Logger = logging.getLogger('pyro')
 
-    options: ProjectOptions = None
+    options: ProjectOptions
 
     flag_types: dict = {
         GameType.FO4: 'Institute_Papyrus_Flags.flg',
@@ -25,28 +38,42 @@ class ProjectBase:
         GameType.SSE: 'Skyrim Special Edition',
         GameType.TES5: 'Skyrim',
     }
-    variables: dict = {}
+    # casefolded folder names used to infer game type from paths, in order of precedence
+    game_folder_names: tuple = (
+        (game_names[GameType.FO4].casefold(), GameType.FO4),
+        (game_names[GameType.FO4].replace(' ', '').casefold(), GameType.FO4),
+        *((game_name.casefold(), game_type) for game_type, game_name in game_names.items() if game_type != GameType.FO4),
+    )
+    variables: dict
+
+    program_path: str
+    project_name: str
+    project_path: str
 
-    program_path: str = ''
-    project_name: str = ''
-    project_path: str = ''
+    import_paths: list
 
-    import_paths: list = []
+    # shared by all instances
+    registry_values: dict = {}
 
-    final: bool = False
-    optimize: bool = False
-    release: bool = False
+    final: bool
+    optimize: bool
+    release: bool
 
     def __init__(self, options: ProjectOptions) -> None:
         self.options = options
+        self.variables = {}
 
-        self.program_path = os.path.dirname(__file__)
-        if endswith(sys.argv[0], ('pyro', '.exe')):
-            self.program_path = os.path.abspath(os.path.join(self.program_path, os.pardir))
+        self.program_path = _PROGRAM_PATH
 
         self.project_name = os.path.splitext(os.path.basename(self.options.input_path))[0]
         self.project_path = os.path.dirname(self.options.input_path)
 
+        self.import_paths = []
+
+        self.final = False
+        self.optimize = False
+        self.release = False
+
     def __setattr__(self, key: str, value: object) -> None:
         if isinstance(value, str) and endswith(key, 'path'):
             if os.altsep in value:
@@ -64,20 +91,25 @@ class ProjectBase:
         :param relative_root_path: Absolute path to directory to join with relative path
         :param fallback_path: Absolute path to return if path empty or unset
         """
-        if path or startswith(path, (os.curdir, os.pardir)):
+        if path:
             return path if os.path.isabs(path) else os.path.normpath(os.path.join(relative_root_path, path))
         if isinstance(fallback_path, list):
-            return os.path.abspath(os.path.join(*fallback_path))
+            # fallback parts are plain names, so a separator join is enough before normalizing
+            fallback_path = os.sep.join(part for part in fallback_path if part)
+            return os.path.normpath(fallback_path) if os.path.isabs(fallback_path) else os.path.abspath(fallback_path)
         return fallback_path
 
     def parse(self, value: str) -> str:
         """Expands string tokens and environment variables, and returns the parsed string"""
+        # most values have nothing to expand, so skip the template and os.path calls for them
+        if StringTemplate.delimiter not in value and '$' not in value and '%' not in value and not value.startswith('~'):
+            return value
+
         t = StringTemplate(value)
         try:
             return os.path.expanduser(os.path.expandvars(t.substitute(self.variables)))
         except KeyError as e:
-            ProjectBase.log.error(f'Failed to parse variable "{e.args[0]}" in "{value}". Is the variable name correct?')
-            sys.exit(1)
+            raise PapyrusProjectError(f'Failed to parse variable "{e.args[0]}" in "{value}". Is the variable name correct?') from e
 
     # build arguments
     def get_worker_limit(self) -> int:
@@ -172,8 +204,6 @@ class ProjectBase:
 
         Used by: BuildFacade, ProjectBase
         """
-        import winreg
-
         registry_path, registry_type = self.options.registry_path, winreg.HKEY_LOCAL_MACHINE
 
         game_type = self.options.game_type if not game_type else game_type
@@ -188,19 +218,22 @@ class ProjectBase:
         if any(hkey == value for value in ('HKCU', 'HKEY_CURRENT_USER')):
             registry_type = winreg.HKEY_CURRENT_USER
 
+        # installed paths do not change while running, so reuse values read by any project
+        registry_key_id: tuple = (registry_type, key_head.casefold(), key_tail.casefold())
+        if registry_key_id in ProjectBase.registry_values:
+            return ProjectBase.registry_values[registry_key_id]
+
         try:
-            registry_key = winreg.OpenKey(registry_type, key_head, 0, winreg.KEY_READ)
-            reg_value, _ = winreg.QueryValueEx(registry_key, key_tail)
-            winreg.CloseKey(registry_key)
-        except WindowsError:
-            ProjectBase.log.error(f'Installed Path for {game_type} '
-                                  f'does not exist in Windows Registry. Run the game launcher once, then try again.')
-            sys.exit(1)
-
-        # noinspection PyUnboundLocalVariable
+            with winreg.OpenKey(registry_type, key_head, 0, winreg.KEY_READ) as registry_key:
+                reg_value, _ = winreg.QueryValueEx(registry_key, key_tail)
+        except OSError as e:
+            raise PapyrusProjectError(f'Installed Path for {game_type} '
+                                      f'does not exist in Windows Registry. Run the game launcher once, then try again.') from e
+
         if not os.path.exists(reg_value):
-            ProjectBase.log.error(f'Installed Path for {game_type} does not exist: {reg_value}')
-            sys.exit(1)
+            raise PapyrusProjectError(f'Installed Path for {game_type} does not exist: {reg_value}')
+
+        ProjectBase.registry_values[registry_key_id] = reg_value
 
         return reg_value
 
@@ -237,34 +270,23 @@ class ProjectBase:
                               fallback_path=[self.program_path, 'remote'])
 
     def _get_game_type_from_path(self, path: str) -> Union[None, GameType]:
-        parts: list = path.casefold().split(os.sep)
-        if self.game_names[GameType.FO4].casefold() in parts:
-            return GameType.FO4
-        if self.game_names[GameType.FO4].casefold().replace(' ', '') in parts:
-            return GameType.FO4
-        if self.game_names[GameType.SSE].casefold() in parts:
-            return GameType.SSE
-        if self.game_names[GameType.TES5].casefold() in parts:
-            return GameType.TES5
+        parts: set = set(path.casefold().split(os.sep))
+        for game_folder_name, game_type in self.game_folder_names:
+            if game_folder_name in parts:
+                return game_type
         return None
 
     # program arguments
     def get_game_type(self) -> GameType:
         """Returns game type from arguments or Papyrus Project"""
-        if isinstance(self.options.game_type, str) and self.options.game_type:
-            if GameType.has_member(self.options.game_type):
-                return GameType[self.options.game_type]
+        if self.options.game_type:
+            return self.options.game_type
 
         if self.options.game_path:
-            if endswith(self.options.game_path, self.game_names[GameType.FO4], ignorecase=True):
-                ProjectBase.log.warning(f'Using game type: {self.game_names[GameType.FO4]} (determined from game path)')
-                return GameType.FO4
-            if endswith(self.options.game_path, self.game_names[GameType.SSE], ignorecase=True):
-                ProjectBase.log.warning(f'Using game type: {self.game_names[GameType.SSE]} (determined from game path)')
-                return GameType.SSE
-            if endswith(self.options.game_path, self.game_names[GameType.TES5], ignorecase=True):
-                ProjectBase.log.warning(f'Using game type: {self.game_names[GameType.TES5]} (determined from game path)')
-                return GameType.TES5
+            for game_type, game_name in self.game_names.items():
+                if endswith(self.options.game_path, game_name, ignorecase=True):
+                    ProjectBase.log.warning(f'Using game type: {game_name} (determined from game path)')
+                    return game_type
 
         if self.options.registry_path:
             game_type = self._get_game_type_from_path(self.options.registry_path)
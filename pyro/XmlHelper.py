@@ -1,4 +1,4 @@
-import io
+import functools
 import os
 import re
 import typing
@@ -7,16 +7,39 @@ from lxml import etree
 
 
 class XmlHelper:
+    comments_pattern: typing.Pattern = re.compile('(<!--.*?-->)', flags=re.DOTALL)
+
     @staticmethod
-    def strip_xml_comments(path: str) -> io.StringIO:
+    def strip_xml_comments(path: str, chunk_size: int = 65536) -> typing.Generator:
+        """Yields chunks of XML document text with comments removed"""
+        pending_text: str = ''
+
         with open(path, encoding='utf-8') as f:
-            xml_document: str = f.read()
-            comments_pattern = re.compile('(<!--.*?-->)', flags=re.DOTALL)
-            xml_document = comments_pattern.sub('', xml_document)
-        return io.StringIO(xml_document)
+            for chunk in iter(lambda: f.read(chunk_size), ''):
+                text: str = XmlHelper.comments_pattern.sub('', pending_text + chunk)
+
+                # hold back an unterminated comment, or a partial comment opener, until the next chunk
+                comment_start: int = text.find('<!--')
+                if comment_start < 0:
+                    comment_start = text.rfind('<', -3)
+                    if comment_start > -1 and not '<!--'.startswith(text[comment_start:]):
+                        comment_start = -1
+
+                if comment_start > -1:
+                    text, pending_text = text[:comment_start], text[comment_start:]
+                else:
+                    pending_text = ''
+
+                if text:
+                    yield text
+
+        if pending_text:
+            yield pending_text
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def validate_schema(namespace: str, program_path: str) -> typing.Optional[etree.XMLSchema]:
+        """Returns compiled schema for namespace, reused for every project loaded with the same schema"""
         if not namespace:
             return None
 